@@ -511,8 +511,10 @@ class GBPUploader:
             if should_create_page:
                 upload_page = await self.context.new_page()
                 logger.debug(f"新規ページでURLへ移動: {gbp_url}")
-                await upload_page.goto(gbp_url, timeout=self.default_timeout, wait_until='networkidle')
-                logger.debug("ページ移動完了 (networkidle)。")
+                # GBPページはテレメトリ等で networkidle にならないことが多いため domcontentloaded で十分
+                # (後続の wait_for_selector が実際の操作可能状態を保証する)
+                await upload_page.goto(gbp_url, timeout=self.default_timeout, wait_until='domcontentloaded')
+                logger.debug("ページ移動完了 (domcontentloaded)。")
             
             logger.debug(f"現在のページ ({upload_page.url}) でアップロード処理を開始します")
             
@@ -757,7 +759,9 @@ async def _async_upload_logic(pw_manager: PlaywrightManager, gbp_url: str, image
         
         # --- 2. GBP URLへ移動 --- 
         logger.info(f"ログイン確認完了。同じページでGBP URLへ移動します: {gbp_url}")
-        await page.goto(gbp_url, timeout=60000, wait_until='networkidle')
+        # networkidle はGBPのロングポーリングでタイムアウトまで待たされるため domcontentloaded を使用
+        # (直後のオーナー確認 / 写真追加ボタンの wait_for_selector が正しさを保証する)
+        await page.goto(gbp_url, timeout=60000, wait_until='domcontentloaded')
         logger.debug(f"GBP URLへの移動完了: {page.url}")
 
         # --- 2.5 オーナー確認ステップ / スキップ判定 ---
@@ -845,10 +849,15 @@ async def _async_upload_logic(pw_manager: PlaywrightManager, gbp_url: str, image
         # GBPUploader内でエラーページ保存を試みるが、ここでも念のため
         if page and not page.is_closed():
             try:
-                # PlaywrightManagerに移動した方が良い
+                # スクリーンショットは5秒で打ち切り、ページのハングで
+                # エラーリカバリ全体が塞がれるのを防ぐ
+                # (finally でページを閉じる前に完了させる必要がある)
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
-                await page.screenshot(path=f"error_async_logic_{timestamp}.png")
-            except:
+                await asyncio.wait_for(page.screenshot(
+                    path=f"error_async_logic_{timestamp}.png",
+                    full_page=False
+                ), timeout=5)
+            except Exception:
                  pass
         return False
     finally:
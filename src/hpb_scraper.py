@@ -1,10 +1,14 @@
 import requests
 from bs4 import BeautifulSoup
+import hashlib
+import json
 import os
+import threading
 import urllib.parse
 import time
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Tuple, Optional, Dict, Any
 
 from src.config_manager import get_hpb_selectors, get_settings
@@ -14,18 +18,78 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # 一時ディレクトリ (プロジェクトルートからの相対パスを想定)
+# モジュール読み込み時に一度だけ作成し、ダウンロードごとの存在チェックを省略する
 TEMP_DIR = os.path.join(os.path.dirname(__file__), '..', 'temp')
+os.makedirs(TEMP_DIR, exist_ok=True)
+
+# 最大ページ数キャッシュ (サロンごとのページ数は頻繁には変わらないため、プローブ用リクエストを省略する)
+MAXPAGE_CACHE_PATH = os.path.join(TEMP_DIR, '.maxpage_cache.json')
+MAXPAGE_CACHE_TTL_SECONDS = 86400  # 24時間
+
+# ETagキャッシュ (未変更の画像は HEAD リクエストのみで再ダウンロードを省略する)
+ETAG_CACHE_PATH = os.path.join(TEMP_DIR, '.etag_cache.json')
+
+# コネクションプーリングのため全リクエストで共有するセッション
+# (接続先は実質 beauty.hotpepper.jp と画像CDNの2ホストのみ)
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
 
 # --- Helper Functions --- #
 
-def _make_request(url: str, retries: int = 3, delay: float = 1.0) -> Optional[requests.Response]:
+def _load_maxpage_cache() -> Dict[str, Any]:
+    """最大ページ数キャッシュファイルを読み込む。存在しない・不正な場合は空の辞書を返す。"""
+    try:
+        with open(MAXPAGE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+
+def _save_maxpage_cache(cache: Dict[str, Any]) -> None:
+    """最大ページ数キャッシュをファイルに保存する。失敗しても処理は継続する。"""
+    try:
+        os.makedirs(os.path.dirname(MAXPAGE_CACHE_PATH), exist_ok=True)
+        with open(MAXPAGE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning(f"最大ページ数キャッシュの保存に失敗しました: {e}")
+
+def _invalidate_maxpage_cache(hpb_top_url: str) -> None:
+    """指定URLの最大ページ数キャッシュを無効化する (ページ構成の変化を検出した場合など)。"""
+    if not hpb_top_url.endswith('/'):
+        hpb_top_url += '/'
+    cache = _load_maxpage_cache()
+    if hpb_top_url in cache:
+        del cache[hpb_top_url]
+        _save_maxpage_cache(cache)
+        logger.info(f"最大ページ数キャッシュを無効化しました: {hpb_top_url}")
+
+def _load_etag_cache() -> Dict[str, Any]:
+    """ETagキャッシュファイルを読み込む。存在しない・不正な場合は空の辞書を返す。"""
+    try:
+        with open(ETAG_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+
+def _save_etag_cache(cache: Dict[str, Any]) -> None:
+    """ETagキャッシュをファイルに保存する。失敗しても処理は継続する。"""
+    try:
+        os.makedirs(os.path.dirname(ETAG_CACHE_PATH), exist_ok=True)
+        with open(ETAG_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except (OSError, TypeError) as e:
+        logger.warning(f"ETagキャッシュの保存に失敗しました: {e}")
+
+def _make_request(url: str, retries: int = 3, delay: float = 1.0, method: str = 'get', stream: bool = False) -> Optional[requests.Response]:
     """指定されたURLにリクエストを送信し、レスポンスを返す。リトライ機能付き。"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
     for i in range(retries):
         try:
-            response = requests.get(url, headers=headers, timeout=15)
+            response = _session.request(method.upper(), url, timeout=15, stream=stream)
             response.raise_for_status() # HTTPエラーがあれば例外発生
             return response
         except requests.exceptions.RequestException as e:
@@ -43,8 +107,9 @@ def _get_cleaned_image_url(src: str, cleanup_pattern: str) -> Optional[str]:
     url_parts = urllib.parse.urlsplit(src)
     cleaned_url = urllib.parse.urlunsplit((url_parts.scheme, url_parts.netloc, url_parts.path, '', ''))
     # 特定のパターンを除去 (configで指定されたパターン)
-    if cleanup_pattern and cleanup_pattern in cleaned_url:
-        cleaned_url = cleaned_url.split(cleanup_pattern)[0]
+    # partition は1回の走査で分割し、パターンがなければ元の文字列をそのまま返す
+    if cleanup_pattern:
+        cleaned_url = cleaned_url.partition(cleanup_pattern)[0]
     
     # 不完全なURLやデータURIなどをフィルタリング (簡単なチェック)
     if not cleaned_url.startswith(('http://', 'https://')) or ';base64,' in cleaned_url:
@@ -96,6 +161,13 @@ def _get_style_page_info(hpb_top_url: str) -> Tuple[Optional[str], int]:
         logger.warning("設定ファイルに最大ページ数要素セレクタ (max_page_element) がありません。ページ数を1と仮定します。")
         return style_base_url, 1
 
+    # キャッシュにTTL内のエントリがあればプローブ用リクエストを省略
+    cache_entry = _load_maxpage_cache().get(hpb_top_url)
+    if cache_entry and time.time() - cache_entry.get('ts', 0) < MAXPAGE_CACHE_TTL_SECONDS:
+        cached_max_page = cache_entry.get('max_page', 1)
+        logger.info(f"キャッシュから最大ページ数を取得: {cached_max_page} ({hpb_top_url})")
+        return style_base_url, cached_max_page
+
     logger.info(f"最初のスタイルページにアクセス中: {style_base_url}")
     response = _make_request(style_base_url)
     if not response:
@@ -129,6 +201,11 @@ def _get_style_page_info(hpb_top_url: str) -> Tuple[Optional[str], int]:
         logger.error(f"最大ページ数取得中にエラー: {e}", exc_info=True)
         # エラー発生時も1ページとみなす
 
+    # 取得結果をキャッシュに保存 (次回以降のプローブ用リクエストを省略するため)
+    cache = _load_maxpage_cache()
+    cache[hpb_top_url] = {'max_page': max_page, 'ts': time.time()}
+    _save_maxpage_cache(cache)
+
     logger.info(f"スタイルベースURL: {style_base_url}, 最大ページ数: {max_page}")
     return style_base_url, max_page
 
@@ -191,6 +268,9 @@ def fetch_latest_style_images(hpb_top_url: str, order: str = 'backward') -> List
 
         response = _make_request(page_url)
         if not response:
+            # 2ページ目以降の取得失敗はキャッシュされた最大ページ数が古い可能性がある
+            if page_num > 1:
+                _invalidate_maxpage_cache(hpb_top_url)
             continue # エラーなら次のページへ
 
         try:
@@ -209,12 +289,14 @@ def fetch_latest_style_images(hpb_top_url: str, order: str = 'backward') -> List
                     logger.error("スタイル画像が1枚も見つかりませんでした。サイト構造の変更またはセレクタの問題の可能性があります。")
                     return []
 
+            # src属性を先にまとめて抽出 (BS4の属性アクセスを内側のループから排除)
+            srcs = [img.get('src') for img in img_elements]
+
             # 取得順序に応じてページ内の画像処理順序を設定
             # backward の場合は reversed を維持し、forward の場合はそのまま (HTML順)
-            image_elements_to_process = reversed(img_elements) if order == 'backward' else img_elements
+            srcs_to_process = reversed(srcs) if order == 'backward' else srcs
 
-            for img in image_elements_to_process:
-                src = img.get('src')
+            for src in srcs_to_process:
                 cleaned_url = _get_cleaned_image_url(src, cleanup_pattern)
 
                 if cleaned_url and cleaned_url not in unique_image_urls:
@@ -236,12 +318,19 @@ def fetch_latest_style_images(hpb_top_url: str, order: str = 'backward') -> List
     logger.info(f"合計 {len(fetched_urls_list)} 件のユニークな画像URLを取得しました。")
     return fetched_urls_list
 
-def download_images(image_urls: List[str], temp_dir: str = TEMP_DIR, progress_callback=None) -> List[str]:
-    """画像URLのリストから画像をダウンロードし、保存先のパスリストを返す。"""
+def download_images(image_urls: List[str], temp_dir: str = TEMP_DIR, progress_callback=None,
+                    cancel_event: Optional[threading.Event] = None,
+                    percent_callback=None) -> List[str]:
+    """画像URLのリストから画像をダウンロードし、保存先のパスリストを返す。
+
+    cancel_event がセットされると未処理の画像をスキップして早期に終了する
+    (ユーザーの中断時に帯域を無駄にしないため)。
+    percent_callback は1件完了するごとに (完了数, 総数) で呼び出される。
+    """
     logger.info(f"{len(image_urls)} 件の画像をダウンロード中...")
-    downloaded_paths = []
 
-    if not os.path.exists(temp_dir):
+    # TEMP_DIR はモジュール読み込み時に作成済み。カスタムディレクトリ指定時のみ作成する
+    if temp_dir is not TEMP_DIR and not os.path.exists(temp_dir):
         try:
             os.makedirs(temp_dir)
             logger.info(f"一時ディレクトリを作成しました: {temp_dir}")
@@ -249,47 +338,119 @@ def download_images(image_urls: List[str], temp_dir: str = TEMP_DIR, progress_ca
             logger.error(f"一時ディレクトリの作成に失敗しました: {temp_dir} - {e}")
             return []
 
-    for i, url in enumerate(image_urls):
+    etag_cache = _load_etag_cache()
+    etag_cache_dirty = False
+    etag_cache_lock = threading.Lock()
+
+    settings = get_settings()
+    delay = settings.get('download_delay_seconds', 0.5)
+    max_workers = settings.get('download_max_workers', 4)
+    total = len(image_urls)
+
+    def _download_one(i: int, url: str) -> Optional[str]:
+        """1件の画像をダウンロードし、保存先パスを返す。失敗・キャンセル時は None。"""
+        nonlocal etag_cache_dirty
+        if cancel_event is not None and cancel_event.is_set():
+            return None
         try:
             # 進捗をコールバックで報告
             if progress_callback:
-                progress_callback(f"{i+1}/{len(image_urls)}枚目の画像をダウンロード中...")
-                
-            response = _make_request(url)
-            if response and response.content:
-                # ファイル名を生成 (例: image_001.jpg)
-                file_extension = os.path.splitext(urllib.parse.urlparse(url).path)[1] or '.jpg' # 拡張子がなければ.jpg
-                # 拡張子にクエリパラメータなどが含まれる場合があるため、基本的なものに限定
-                if file_extension.lower() not in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-                    file_extension = '.jpg' # 不明な場合はjpgとする
-                
-                filename = f"image_{i+1:03d}{file_extension}"
-                filepath = os.path.join(temp_dir, filename)
-
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                logger.info(f"画像を保存しました ({i+1}/{len(image_urls)}): {filepath} (from {url})")
-                downloaded_paths.append(filepath)
-                
+                progress_callback(f"{i+1}/{total}枚目の画像をダウンロード中...")
+
+            # ファイル名を生成 (例: image_3f6a2b1c9d0e.jpg)
+            file_extension = os.path.splitext(urllib.parse.urlparse(url).path)[1] or '.jpg' # 拡張子がなければ.jpg
+            # 拡張子にクエリパラメータなどが含まれる場合があるため、基本的なものに限定
+            if file_extension.lower() not in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
+                file_extension = '.jpg' # 不明な場合はjpgとする
+
+            # URLごとに安定したファイル名 (ETagキャッシュでの再利用を可能にするため連番ではなくハッシュを使用)
+            filename = f"image_{hashlib.md5(url.encode('utf-8')).hexdigest()[:12]}{file_extension}"
+            filepath = os.path.join(temp_dir, filename)
+
+            # 既存ファイルがあり ETag が一致すれば HEAD リクエストのみで再ダウンロードを省略
+            cached = etag_cache.get(url)
+            if cached and os.path.exists(filepath):
+                head_response = _make_request(url, method='head')
+                head_etag = head_response.headers.get('ETag') if head_response else None
+                if isinstance(head_etag, str) and head_etag == cached.get('etag'):
+                    logger.info(f"画像は未変更のため再利用します ({i+1}/{total}): {filepath}")
+                    if progress_callback:
+                        progress_callback(f"{i+1}/{total}枚目の画像は未変更のため再利用します")
+                    return filepath
+
+            # レスポンスボディはメモリに溜めずチャンク単位でディスクへ書き出す
+            response = _make_request(url, stream=True)
+            bytes_written = 0
+            if response:
+                try:
+                    with open(filepath, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            # 転送中のキャンセルにも応答し、接続と書きかけのファイルを破棄する
+                            if cancel_event is not None and cancel_event.is_set():
+                                response.close()
+                                f.close()
+                                os.remove(filepath)
+                                logger.info(f"ダウンロードを中断しました: {url}")
+                                return None
+                            if chunk:
+                                f.write(chunk)
+                                bytes_written += len(chunk)
+                finally:
+                    response.close()
+
+            if response and bytes_written > 0:
+                logger.info(f"画像を保存しました ({i+1}/{total}): {filepath} (from {url})")
+
+                # ETagがあれば次回以降の再ダウンロード省略のために記録
+                etag = response.headers.get('ETag')
+                if isinstance(etag, str):
+                    with etag_cache_lock:
+                        etag_cache[url] = {'etag': etag}
+                        etag_cache_dirty = True
+
                 # ダウンロード完了を報告
                 if progress_callback:
-                    progress_callback(f"{i+1}/{len(image_urls)}枚目の画像をダウンロードしました")
+                    progress_callback(f"{i+1}/{total}枚目の画像をダウンロードしました")
+
+                # ダウンロードの間にも少し待機 (サーバー負荷軽減)
+                time.sleep(delay / 2)
+                return filepath
             else:
+                # 空レスポンス時に作成された0バイトのファイルを残さない
+                if response and os.path.exists(filepath):
+                    os.remove(filepath)
                 logger.warning(f"画像のダウンロードに失敗しました (空のレスポンス): {url}")
                 # エラーをコールバックで報告
                 if progress_callback:
-                    progress_callback(f"{i+1}/{len(image_urls)}枚目の画像ダウンロードに失敗しました")
-
-            # ダウンロードの間にも少し待機 (サーバー負荷軽減)
-            settings = get_settings()
-            delay = settings.get('download_delay_seconds', 0.5)
-            time.sleep(delay / 2)
+                    progress_callback(f"{i+1}/{total}枚目の画像ダウンロードに失敗しました")
+                return None
 
         except Exception as e:
             logger.error(f"画像のダウンロード/保存中にエラー: {url} - {e}", exc_info=True)
             # エラーをコールバックで報告
             if progress_callback:
-                progress_callback(f"{i+1}/{len(image_urls)}枚目の画像処理中にエラーが発生しました: {str(e)}")
+                progress_callback(f"{i+1}/{total}枚目の画像処理中にエラーが発生しました: {str(e)}")
+            return None
+
+    # ダウンロードを並列実行 (共有セッションによりコネクションを再利用)
+    results: List[Optional[str]] = [None] * total
+    completed = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_download_one, i, url): i for i, url in enumerate(image_urls)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            completed += 1
+            if percent_callback:
+                percent_callback(completed, total)
+
+    # 元のURL順を維持して結果を組み立てる
+    downloaded_paths = [path for path in results if path]
+
+    if etag_cache_dirty:
+        _save_etag_cache(etag_cache)
+
+    if cancel_event is not None and cancel_event.is_set():
+        logger.info("画像ダウンロードがキャンセルされました。")
 
     logger.info(f"合計 {len(downloaded_paths)} 件の画像をダウンロードしました。")
     return downloaded_paths
@@ -1,17 +1,20 @@
 import os
 import sys
 import logging
+import threading
 import time
+from collections import deque
+from functools import cached_property, lru_cache
 from typing import List, Dict, Optional
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QProgressBar,
-    QScrollArea, QGridLayout, QCheckBox, QMessageBox,
-    QTextEdit, QGroupBox, QStatusBar, QSizePolicy, QFrame,
-    QApplication, QSpacerItem, QTabWidget, QToolButton, QButtonGroup, QRadioButton, QStyle
+    QMessageBox, QTextEdit, QGroupBox, QFrame,
+    QApplication, QButtonGroup, QRadioButton, QStyle,
+    QListView, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QSize, QThreadPool, QRunnable, pyqtSignal, QObject, pyqtSlot, QMargins
-from PyQt6.QtGui import QPixmap, QImage, QIcon, QFont, QColor, QPalette, QCursor, QGuiApplication, QPainter, QBrush, QPen, QLinearGradient, QGradient
+from PyQt6.QtCore import Qt, QSize, QThread, QThreadPool, QRunnable, pyqtSignal, QObject, pyqtSlot, QTimer
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QIcon, QFont, QCursor, QGuiApplication, QStandardItemModel, QStandardItem
 
 from src.config_manager import get_settings
 from src.hpb_scraper import get_salon_name, fetch_latest_style_images, download_images
@@ -20,6 +23,300 @@ from src.gbp_uploader import check_login, login_to_google, manual_login, upload_
 # ロギング設定
 logger = logging.getLogger(__name__)
 
+# サムネイルの一辺のサイズ (px)
+THUMBNAIL_SIZE = 200
+
+# ログ表示エリアの最大行数 (超過分は古い行から破棄されメモリを抑える)
+LOG_MAX_BLOCKS = 500
+
+# カラーパレットとスタイルシートは静的なため、モジュール読み込み時に一度だけ組み立てる
+PALETTE = {
+    'primary': '#4285F4',       # Google青
+    'primary_dark': '#3367d6',  # Google青の暗い色
+    'secondary': '#34A853',     # Google緑
+    'secondary_dark': '#2e8b46', # Google緑の暗い色
+    'accent': '#EA4335',        # Google赤
+    'neutral': '#FBBC05',       # Google黄
+    'background': '#f5f5f5',    # 背景色（明るいグレー）
+    'card_bg': '#ffffff',       # カード背景色
+    'card_border': '#e0e0e0',   # カード枠線色
+    'text': '#202124',          # テキスト色（ダークグレー）
+    'light_text': '#5f6368',    # 薄いテキスト色
+    'border': '#dadce0',        # ボーダー色
+    'card': '#ffffff',          # カード背景色
+    'disabled': '#bdc1c6',      # 無効状態色
+    'success': '#34A853',       # 成功色
+    'error': '#EA4335',         # エラー色
+    'warning': '#FBBC05'        # 警告色
+}
+
+GLOBAL_QSS = f"""
+    QMainWindow {{
+        background-color: {PALETTE['background']};
+    }}
+    QGroupBox {{
+        font-weight: bold;
+        border: 1px solid {PALETTE['border']};
+        border-radius: 8px;
+        margin-top: 1.5ex;
+        padding: 12px;
+        background-color: {PALETTE['card']};
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 8px;
+        color: {PALETTE['text']};
+        font-size: 13px;
+        background-color: {PALETTE['card']};
+    }}
+    QPushButton {{
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        background-color: {PALETTE['card']};
+        color: {PALETTE['text']};
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: #e8eaed;
+    }}
+    QPushButton:pressed {{
+        background-color: #dadce0;
+    }}
+    QPushButton:disabled {{
+        color: {PALETTE['disabled']};
+        background-color: #f1f3f4;
+    }}
+    QLineEdit {{
+        border: 1px solid {PALETTE['border']};
+        border-radius: 4px;
+        padding: 8px;
+        background-color: white;
+        selection-background-color: {PALETTE['primary']};
+        min-height: 20px;
+    }}
+    QLineEdit:focus {{
+        border: 2px solid {PALETTE['primary']};
+    }}
+    QLabel {{
+        color: {PALETTE['text']};
+    }}
+    QProgressBar {{
+        border: none;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #e0e0e0;
+        min-height: 6px;
+        max-height: 6px;
+    }}
+    QProgressBar::chunk {{
+        background-color: {PALETTE['primary']};
+        border-radius: 4px;
+    }}
+    QCheckBox {{
+        spacing: 5px;
+    }}
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+        border-radius: 3px;
+        border: 1px solid {PALETTE['border']};
+    }}
+    QCheckBox::indicator:checked {{
+        background-color: {PALETTE['primary']};
+        border: none;
+        image: url(:/qt-project.org/styles/commonstyle/images/check-white.png);
+    }}
+    QScrollArea {{
+        border: 1px solid {PALETTE['border']};
+        border-radius: 8px;
+        background-color: white;
+    }}
+    QScrollBar:vertical {{
+        border: none;
+        background-color: #f1f3f4;
+        width: 10px;
+        margin: 0px;
+    }}
+    QScrollBar::handle:vertical {{
+        background-color: #dadce0;
+        border-radius: 5px;
+        min-height: 20px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background-color: #bdc1c6;
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    QScrollBar:horizontal {{
+        border: none;
+        background-color: #f1f3f4;
+        height: 10px;
+        margin: 0px;
+    }}
+    QScrollBar::handle:horizontal {{
+        background-color: #dadce0;
+        border-radius: 5px;
+        min-width: 20px;
+    }}
+    QScrollBar::handle:horizontal:hover {{
+        background-color: #bdc1c6;
+    }}
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+        width: 0px;
+    }}
+    QTextEdit {{
+        border: 1px solid {PALETTE['border']};
+        border-radius: 8px;
+        background-color: white;
+        selection-background-color: {PALETTE['primary']};
+        padding: 5px;
+    }}
+    QFrame {{
+        border-radius: 8px;
+    }}
+"""
+
+# アイコンキャッシュの保持上限 (超過時は最も古いエントリから破棄)
+ICON_CACHE_MAX_ENTRIES = 256
+
+# ディスク上のサムネイルキャッシュのサイドカー拡張子 (例: image_abc.jpg.thumb.jpg)
+THUMBNAIL_SIDECAR_SUFFIX = ".thumb.jpg"
+
+# ログイン状態キャッシュの有効期間 (秒)。期間内の再投稿ではブラウザ起動を伴う確認を省く
+LOGIN_STATE_TTL_SECONDS = 300
+
+@lru_cache(maxsize=512)
+def _display_names(image_path: str):
+    """パスから (ファイル名, 省略表示名) を求める。再表示のたびの文字列加工を省く。"""
+    filename = os.path.basename(image_path)
+    if len(filename) > 20:
+        # ファイル名が長い場合は省略
+        display_name = filename[:10] + "..." + filename[-7:]
+    else:
+        display_name = filename
+    return filename, display_name
+
+def _pixmap_cache_key(image_path: str) -> str:
+    """QPixmapCache 用のサムネイルキャッシュキーを生成する。
+
+    ファイル名はURLベースで安定しているため、更新時刻をキーに含めて
+    同名パスへの再ダウンロードでキャッシュが自動的に無効化されるようにする。
+    """
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return f"thumb:{image_path}:{mtime_ns}"
+
+def _read_scaled_image(image_path: str) -> QImage:
+    """画像をサムネイルサイズにスケーリングしながらデコードする。
+
+    QImageReader.setScaledSize によりデコーダ側で縮小されるため、
+    フル解像度の QImage を一度も生成しない。生成したサムネイルは
+    サイドカーファイルとしてディスクにも保存し、アプリ再起動後の
+    再表示はフル画像ではなく小さなサムネイルのデコードだけで済ませる。
+    """
+    # 元画像より新しいサイドカーがあればそれを読む
+    thumb_path = image_path + THUMBNAIL_SIDECAR_SUFFIX
+    try:
+        if os.path.getmtime(thumb_path) >= os.path.getmtime(image_path):
+            thumb = QImage(thumb_path)
+            if not thumb.isNull():
+                return thumb
+    except OSError:
+        pass
+
+    reader = QImageReader(image_path)
+    reader.setAutoTransform(True)  # EXIFの回転情報を反映
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(
+            THUMBNAIL_SIZE, THUMBNAIL_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio
+        ))
+    image = reader.read()
+    if not image.isNull():
+        # 保存失敗 (ディスクフル等) は表示に影響しないため無視する
+        image.save(thumb_path, "JPEG", 85)
+    return image
+
+# 非モーダル通知バナーのスタイル (levelプロパティで色分け)
+STATUS_BANNER_QSS = f"""
+    QLabel {{
+        border-radius: 6px;
+        padding: 10px 14px;
+        font-weight: bold;
+        color: white;
+    }}
+    QLabel[level="info"] {{
+        background-color: {PALETTE['success']};
+    }}
+    QLabel[level="warning"] {{
+        background-color: {PALETTE['warning']};
+        color: {PALETTE['text']};
+    }}
+    QLabel[level="error"] {{
+        background-color: {PALETTE['error']};
+    }}
+"""
+
+FETCH_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {PALETTE['primary']};
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        min-height: 40px;
+        padding: 0 20px;
+        border-radius: 6px;
+        text-align: left;
+    }}
+    QPushButton[busy="true"] {{
+        background-color: {PALETTE['disabled']};
+    }}
+"""
+
+UPLOAD_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {PALETTE['secondary']};
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        min-height: 40px;
+        padding: 0 20px;
+        border-radius: 6px;
+        text-align: left;
+    }}
+    QPushButton[busy="true"] {{
+        background-color: {PALETTE['disabled']};
+    }}
+"""
+
+LOGIN_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: white;
+        border: 1px solid {PALETTE['border']};
+        border-radius: 6px;
+        min-height: 36px;
+        text-align: left;
+    }}
+    QPushButton[loginState="ok"] {{
+        background-color: {PALETTE['success']};
+        color: white;
+        font-weight: bold;
+        border: none;
+    }}
+    QPushButton[loginState="error"] {{
+        background-color: {PALETTE['error']};
+        color: white;
+        font-weight: bold;
+        border: none;
+    }}
+"""
+
 # ----- ワーカースレッド用のクラス -----
 
 class WorkerSignals(QObject):
@@ -39,6 +336,8 @@ class Worker(QRunnable):
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
+        # 実行完了後はプールに破棄させる (既定値だが意図を明示)
+        self.setAutoDelete(True)
         
     @pyqtSlot()
     def run(self):
@@ -59,7 +358,10 @@ class MainWindow(QMainWindow):
     """アプリケーションのメインウィンドウ"""
     
     # UI更新用のシグナルを追加
-    update_log_signal = pyqtSignal(str)
+    # ワーカースレッドからログフラッシュの予約を依頼するキック用シグナル
+    # (メッセージ本体はdequeで受け渡すため引数は持たない)
+    update_log_signal = pyqtSignal()
+    update_progress_signal = pyqtSignal(int)
 
     def __init__(self):
         super().__init__()
@@ -68,39 +370,56 @@ class MainWindow(QMainWindow):
         self.setup_application_style()
         
         self.threadpool = QThreadPool()
+        # このプールに載るのはパイプライン・サロン名取得・ログイン系の
+        # 数個のワーカーのみ。画像ダウンロードのファンアウトは
+        # download_images 内の ThreadPoolExecutor が担うため、
+        # ここで広いプールを確保する必要はない
+        self.threadpool.setMaxThreadCount(4)
         logger.debug(f"利用可能なスレッド数: {self.threadpool.maxThreadCount()}")
         
         self.salon_name = ""  # サロン名を保存
         self.image_paths = []  # ダウンロードした画像のパスを保存
-        self.image_checkboxes = []  # 画像のチェックボックスを保存
-        
+        # サムネイルはQtのグローバルLRUキャッシュ (QPixmapCache) に保持する
+        QPixmapCache.setCacheLimit(64 * 1024)  # KB単位 (約400枚分のサムネイル)
+        # サムネイルキー (パス+更新時刻) -> QIcon (同一ピクスマップを全アイテムで共有)
+        self._icon_cache = {}
+        self._download_cancel_event = None  # 実行中ダウンロードの中断用イベント
+        self._fetch_in_progress = False  # 取得パイプラインの多重起動防止フラグ
+
+        # チェック済みアイテム数 (itemChanged で増減し、全走査せずに参照できる)
+        self._checked_count = 0
+        self._updating_model = False  # プログラム側の一括更新中はカウンタ補正を止める
+
+        # ログイン状態のキャッシュ (TTL内は投稿時の再確認を省略する)
+        self._login_state: Optional[bool] = None
+        self._login_checked_at = 0.0
+
+        # ログタイムスタンプのメモ化 (同一秒内の strftime 呼び出しを省略)
+        self._cached_log_second = 0
+        self._cached_log_timestamp = ""
+
+        # ログのデバウンス用バッファ (バースト時の再描画を1回にまとめる)
+        # deque の append/popleft はGILによりアトミックなため、
+        # ワーカースレッドからロックなしで直接書き込める
+        self._pending_log_lines = deque(maxlen=4096)
+        self._log_flush_scheduled = False  # キックシグナルの多重発行を抑えるフラグ
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+
+        # シグナルとスロットを接続 (init_ui 中のログを取りこぼさないよう先に接続する)
+        self.update_log_signal.connect(self._schedule_log_flush)
+
         self.init_ui()
-        
-        # シグナルとスロットを接続
-        self.update_log_signal.connect(self._append_log_text)
+
+        # プログレスバーはワーカースレッドからシグナル経由で更新する
+        self.update_progress_signal.connect(self.progress_bar.setValue)
     
     def setup_application_style(self):
         """アプリケーション全体のスタイル設定"""
         # カラーパレット
-        self.palette = {
-            'primary': '#4285F4',       # Google青
-            'primary_dark': '#3367d6',  # Google青の暗い色
-            'secondary': '#34A853',     # Google緑
-            'secondary_dark': '#2e8b46', # Google緑の暗い色
-            'accent': '#EA4335',        # Google赤
-            'neutral': '#FBBC05',       # Google黄
-            'background': '#f5f5f5',    # 背景色（明るいグレー）
-            'card_bg': '#ffffff',       # カード背景色
-            'card_border': '#e0e0e0',   # カード枠線色
-            'text': '#202124',          # テキスト色（ダークグレー）
-            'light_text': '#5f6368',    # 薄いテキスト色
-            'border': '#dadce0',        # ボーダー色
-            'card': '#ffffff',          # カード背景色
-            'disabled': '#bdc1c6',      # 無効状態色
-            'success': '#34A853',       # 成功色
-            'error': '#EA4335',         # エラー色
-            'warning': '#FBBC05'        # 警告色
-        }
+        self.palette = PALETTE
         
         # デバイスのピクセル比を取得してHiDPI対応
         pixel_ratio = QGuiApplication.primaryScreen().devicePixelRatio()
@@ -117,146 +436,43 @@ class MainWindow(QMainWindow):
         status_font = QFont("Hiragino Sans", 9)
         self.statusBar().setFont(status_font)
         
-        # グローバルスタイルシート
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {self.palette['background']};
-            }}
-            QGroupBox {{
-                font-weight: bold;
-                border: 1px solid {self.palette['border']};
-                border-radius: 8px;
-                margin-top: 1.5ex;
-                padding: 12px;
-                background-color: {self.palette['card']};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 8px;
-                color: {self.palette['text']};
-                font-size: 13px;
-                background-color: {self.palette['card']};
-            }}
-            QPushButton {{
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                background-color: {self.palette['card']};
-                color: {self.palette['text']};
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #e8eaed;
-            }}
-            QPushButton:pressed {{
-                background-color: #dadce0;
-            }}
-            QPushButton:disabled {{
-                color: {self.palette['disabled']};
-                background-color: #f1f3f4;
-            }}
-            QLineEdit {{
-                border: 1px solid {self.palette['border']};
-                border-radius: 4px;
-                padding: 8px;
-                background-color: white;
-                selection-background-color: {self.palette['primary']};
-                min-height: 20px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {self.palette['primary']};
-            }}
-            QLabel {{
-                color: {self.palette['text']};
-            }}
-            QProgressBar {{
-                border: none;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #e0e0e0;
-                min-height: 6px;
-                max-height: 6px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.palette['primary']};
-                border-radius: 4px;
-            }}
-            QCheckBox {{
-                spacing: 5px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border-radius: 3px;
-                border: 1px solid {self.palette['border']};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.palette['primary']};
-                border: none;
-                image: url(:/qt-project.org/styles/commonstyle/images/check-white.png);
-            }}
-            QScrollArea {{
-                border: 1px solid {self.palette['border']};
-                border-radius: 8px;
-                background-color: white;
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background-color: #f1f3f4;
-                width: 10px;
-                margin: 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: #dadce0;
-                border-radius: 5px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: #bdc1c6;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar:horizontal {{
-                border: none;
-                background-color: #f1f3f4;
-                height: 10px;
-                margin: 0px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: #dadce0;
-                border-radius: 5px;
-                min-width: 20px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: #bdc1c6;
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-            QTextEdit {{
-                border: 1px solid {self.palette['border']};
-                border-radius: 8px;
-                background-color: white;
-                selection-background-color: {self.palette['primary']};
-                padding: 5px;
-            }}
-            QFrame {{
-                border-radius: 8px;
-            }}
-        """)
+        # グローバルスタイルシートはアプリケーション単位で一度だけ適用する
+        # (ウィンドウに付けると子ウィジェット挿入のたびにルールの再マッチが走る)
+        app = QApplication.instance()
+        if app is not None and app.styleSheet() != GLOBAL_QSS:
+            app.setStyleSheet(GLOBAL_QSS)
         
-        # アイコンの設定
-        self.icons = {
-            'fetch': self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload),
-            'upload': self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowUp),
-            'login': self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton),
-            'manual_login': self.style().standardIcon(QStyle.StandardPixmap.SP_DialogHelpButton),
-            'select_all': self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton),
-            'deselect_all': self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton)
-        }
+        # アイコンはcached_propertyで初回アクセス時に遅延生成するため、
+        # ここではQStyleの参照だけを保持しておく
+        self._style = self.style()
     
+    # 標準アイコンはラスタライズにコストがかかるため、初回アクセス時に
+    # 生成してインスタンスにキャッシュする
+
+    @cached_property
+    def icon_fetch(self):
+        return self._style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload)
+
+    @cached_property
+    def icon_upload(self):
+        return self._style.standardIcon(QStyle.StandardPixmap.SP_ArrowUp)
+
+    @cached_property
+    def icon_login(self):
+        return self._style.standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)
+
+    @cached_property
+    def icon_manual_login(self):
+        return self._style.standardIcon(QStyle.StandardPixmap.SP_DialogHelpButton)
+
+    @cached_property
+    def icon_select_all(self):
+        return self._style.standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)
+
+    @cached_property
+    def icon_deselect_all(self):
+        return self._style.standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton)
+
     def init_ui(self):
         """UIの初期化"""
         # メインウィジェットとレイアウト
@@ -276,7 +492,18 @@ class MainWindow(QMainWindow):
             margin-bottom: 10px;
         """)
         main_layout.addWidget(title_label)
-        
+
+        # 非モーダルの通知バナー (モーダルダイアログの代わりに完了・警告を表示)
+        self.status_banner = QLabel()
+        self.status_banner.setStyleSheet(STATUS_BANNER_QSS)
+        self.status_banner.setWordWrap(True)
+        self.status_banner.hide()
+        self._banner_timer = QTimer(self)
+        self._banner_timer.setSingleShot(True)
+        self._banner_timer.setInterval(5000)
+        self._banner_timer.timeout.connect(self.status_banner.hide)
+        main_layout.addWidget(self.status_banner)
+
         # --- URL入力セクション ---
         url_group = QGroupBox("URL設定")
         url_layout = QVBoxLayout(url_group)
@@ -351,36 +578,19 @@ class MainWindow(QMainWindow):
         
         # 画像取得ボタン（強調表示）
         self.fetch_button = QPushButton("  画像を取得")
-        self.fetch_button.setIcon(self.icons['fetch'])
+        self.fetch_button.setIcon(self.icon_fetch)
         self.fetch_button.setIconSize(QSize(18, 18))
-        self.fetch_button.setStyleSheet(f"""
-            background-color: {self.palette['primary']};
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            min-height: 40px;
-            padding: 0 20px;
-            border-radius: 6px;
-            text-align: left;
-        """)
+        # 処理中の見た目は動的プロパティで切り替える (都度のQSS再パースを回避)
+        self.fetch_button.setStyleSheet(FETCH_BUTTON_QSS)
         self.fetch_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.fetch_button.clicked.connect(self.fetch_images)
         main_buttons_layout.addWidget(self.fetch_button)
         
         # 選択した画像を投稿ボタン（強調表示）
         self.upload_button = QPushButton("  選択した画像を投稿")
-        self.upload_button.setIcon(self.icons['upload'])
+        self.upload_button.setIcon(self.icon_upload)
         self.upload_button.setIconSize(QSize(18, 18))
-        self.upload_button.setStyleSheet(f"""
-            background-color: {self.palette['secondary']};
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            min-height: 40px;
-            padding: 0 20px;
-            border-radius: 6px;
-            text-align: left;
-        """)
+        self.upload_button.setStyleSheet(UPLOAD_BUTTON_QSS)
         self.upload_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.upload_button.clicked.connect(self.upload_selected_images)
         self.upload_button.setEnabled(False)
@@ -394,21 +604,17 @@ class MainWindow(QMainWindow):
         
         # Googleログインボタン
         self.login_button = QPushButton("  Googleログイン確認")
-        self.login_button.setIcon(self.icons['login'])
+        self.login_button.setIcon(self.icon_login)
         self.login_button.setIconSize(QSize(16, 16))
-        self.login_button.setStyleSheet(f"""
-            background-color: white;
-            border: 1px solid {self.palette['border']};
-            border-radius: 6px;
-            min-height: 36px;
-            text-align: left;
-        """)
+        # ログイン状態 (ok/error) ごとのルールをあらかじめ定義し、
+        # 状態変更時は動的プロパティの切り替えだけで済ませる
+        self.login_button.setStyleSheet(LOGIN_BUTTON_QSS)
         self.login_button.clicked.connect(self.check_google_login)
         login_buttons_layout.addWidget(self.login_button)
         
         # 手動Googleログインボタン
         self.manual_login_button = QPushButton("  手動Googleログイン")
-        self.manual_login_button.setIcon(self.icons['manual_login'])
+        self.manual_login_button.setIcon(self.icon_manual_login)
         self.manual_login_button.setIconSize(QSize(16, 16))
         self.manual_login_button.setStyleSheet(f"""
             background-color: white;
@@ -441,7 +647,7 @@ class MainWindow(QMainWindow):
         select_buttons_layout.addWidget(select_label)
         
         self.select_all_button = QPushButton("  全て選択")
-        self.select_all_button.setIcon(self.icons['select_all'])
+        self.select_all_button.setIcon(self.icon_select_all)
         self.select_all_button.setIconSize(QSize(16, 16))
         self.select_all_button.setStyleSheet(f"""
             max-width: 120px;
@@ -456,7 +662,7 @@ class MainWindow(QMainWindow):
         select_buttons_layout.addWidget(self.select_all_button)
         
         self.deselect_all_button = QPushButton("  全て解除")
-        self.deselect_all_button.setIcon(self.icons['deselect_all'])
+        self.deselect_all_button.setIcon(self.icon_deselect_all)
         self.deselect_all_button.setIconSize(QSize(16, 16))
         self.deselect_all_button.setStyleSheet(f"""
             max-width: 120px;
@@ -474,19 +680,31 @@ class MainWindow(QMainWindow):
         select_buttons_layout.addStretch()
         images_layout.addLayout(select_buttons_layout)
         
-        # スクロール可能な画像グリッドエリア
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setMinimumHeight(300)  # 最低限の高さを確保
-        scroll_content = QWidget()
-        scroll_content.setStyleSheet(f"background-color: white;")
-        
-        self.images_grid = QGridLayout(scroll_content)
-        self.images_grid.setContentsMargins(10, 10, 10, 10)
-        self.images_grid.setSpacing(15)  # グリッド内の間隔を広げる
-        
-        scroll_area.setWidget(scroll_content)
-        images_layout.addWidget(scroll_area)
+        # モデルベースの画像一覧 (ウィジェットを大量に生成しないアイコンモードのビュー)
+        self.image_model = QStandardItemModel(self)
+        # ユーザー操作によるチェック切り替えをカウンタに反映する
+        self.image_model.itemChanged.connect(self._on_item_changed)
+        self.image_list_view = QListView()
+        self.image_list_view.setModel(self.image_model)
+        self.image_list_view.setViewMode(QListView.ViewMode.IconMode)
+        self.image_list_view.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.image_list_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.image_list_view.setMovement(QListView.Movement.Static)
+        self.image_list_view.setUniformItemSizes(True)
+        # レイアウト計算をバッチ化し、アイテム数が多くても表示開始を遅らせない
+        self.image_list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.image_list_view.setBatchSize(20)
+        self.image_list_view.setSpacing(15)
+        self.image_list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.image_list_view.setMinimumHeight(300)  # 最低限の高さを確保
+        self.image_list_view.setStyleSheet(f"""
+            QListView {{
+                border: 1px solid {self.palette['border']};
+                border-radius: 8px;
+                background-color: white;
+            }}
+        """)
+        images_layout.addWidget(self.image_list_view)
         
         main_layout.addWidget(images_group, 1)  # 画像表示セクションに伸縮性を持たせる
         
@@ -568,6 +786,7 @@ class MainWindow(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(120)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_text.setStyleSheet("""
             border: none;
             background-color: white;
@@ -594,17 +813,39 @@ class MainWindow(QMainWindow):
         # UIの初期化が完了したことをログに記録
         self.log_message("アプリケーションの準備が完了しました。")
     
-    @pyqtSlot(str)
-    def _append_log_text(self, message: str):
-        """メインスレッドでログテキストエリアにメッセージを追加するスロット"""
-        self.log_text.append(message)
-    
+    @pyqtSlot()
+    def _schedule_log_flush(self):
+        """メインスレッドでログのフラッシュタイマーを起動するスロット"""
+        self._log_flush_scheduled = False
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_buffer(self):
+        """バッファに溜まったログメッセージを1回の append でまとめて表示する"""
+        if self._pending_log_lines:
+            lines = []
+            while self._pending_log_lines:
+                lines.append(self._pending_log_lines.popleft())
+            self.log_text.append('\n'.join(lines))
+
     def log_message(self, message: str):
-        """ログメッセージをシグナル経由で表示エリアに追加"""
-        timestamp = time.strftime("%H:%M:%S", time.localtime())
-        formatted_message = f"[{timestamp}] {message}"
-        # 直接UIを更新せず、シグナルを発行する
-        self.update_log_signal.emit(formatted_message)
+        """ログメッセージをバッファ経由で表示エリアに追加"""
+        # タイムスタンプは秒単位でしか変わらないため、同一秒内はフォーマット結果を再利用
+        now = int(time.time())
+        if now != self._cached_log_second:
+            self._cached_log_second = now
+            self._cached_log_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        # メッセージ本体はシグナル引数で運ばず、dequeに直接積む。
+        # シグナルはフラッシュ予約のキックとしてだけ使うため、バースト時も
+        # メッセージごとのMetaCallイベントは発生しない。
+        self._pending_log_lines.append(f"[{self._cached_log_timestamp}] {message}")
+        if QThread.currentThread() is self.thread():
+            if not self._log_flush_timer.isActive():
+                self._log_flush_timer.start()
+        elif not self._log_flush_scheduled:
+            # 競合しても余分なキックが1回飛ぶだけで実害はない
+            self._log_flush_scheduled = True
+            self.update_log_signal.emit()
         logger.info(message) # ロガーへの出力はスレッドセーフ
     
     def check_google_login(self):
@@ -620,38 +861,46 @@ class MainWindow(QMainWindow):
         worker.signals.finished.connect(lambda: self.login_button.setEnabled(True))
         self.threadpool.start(worker)
     
+    def _set_style_property(self, widget, name, value):
+        """ウィジェットの動的プロパティを更新してスタイルを再適用する。
+
+        setStyleSheet による都度のQSS再パースを避け、事前定義済みの
+        属性セレクタルールを切り替えるだけにする。
+        """
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+    def show_banner(self, message: str, level: str = "info"):
+        """画面上部に一時的な通知バナーを表示する。
+
+        QMessageBox と異なりイベントループを塞がないため、表示中も
+        続けて次の操作を行える。5秒後に自動で消える。
+        """
+        self._set_style_property(self.status_banner, "level", level)
+        self.status_banner.setText(message)
+        self.status_banner.show()
+        self._banner_timer.start()
+
     def on_login_check_result(self, is_logged_in):
         """ログイン状態チェック結果の処理"""
+        self._record_login_state(is_logged_in)
         if is_logged_in:
             self.log_message("Googleにログイン済みです")
             self.statusBar().showMessage("Googleにログイン済み")
             
             # ログイン状態を視覚的に表示
-            self.login_button.setStyleSheet(f"""
-                background-color: {self.palette['success']};
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 6px;
-                min-height: 36px;
-                text-align: left;
-            """)
+            self._set_style_property(self.login_button, "loginState", "ok")
             
-            QMessageBox.information(self, "ログイン状態", "Googleにログイン済みです。画像投稿が可能です。")
+            self.show_banner("Googleにログイン済みです。画像投稿が可能です。")
         else:
             self.log_message("Googleにログインが必要です")
             self.statusBar().showMessage("Googleにログインが必要です")
             
             # 未ログイン状態を視覚的に表示
-            self.login_button.setStyleSheet(f"""
-                background-color: {self.palette['error']};
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 6px;
-                min-height: 36px;
-                text-align: left;
-            """)
+            self._set_style_property(self.login_button, "loginState", "error")
             
             reply = QMessageBox.question(
                 self, 'ログイン', 'Googleにログインが必要です。ログインを実行しますか？',
@@ -680,46 +929,39 @@ class MainWindow(QMainWindow):
     
     def on_login_result(self, login_success):
         """ログイン結果の処理"""
+        self._record_login_state(login_success)
         if login_success:
             self.log_message("Googleログインが完了しました")
             self.statusBar().showMessage("Googleログイン完了")
             
             # ログイン成功状態を視覚的に表示
-            self.login_button.setStyleSheet(f"""
-                background-color: {self.palette['success']};
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 6px;
-                min-height: 36px;
-                text-align: left;
-            """)
+            self._set_style_property(self.login_button, "loginState", "ok")
             
-            QMessageBox.information(self, "ログイン完了", "Googleログインが完了しました。画像投稿が可能です。")
+            self.show_banner("Googleログインが完了しました。画像投稿が可能です。")
         else:
             self.log_message("Googleログインに失敗しました")
             self.statusBar().showMessage("Googleログイン失敗")
             
             # ログイン失敗状態を視覚的に表示
-            self.login_button.setStyleSheet(f"""
-                background-color: {self.palette['error']};
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 6px;
-                min-height: 36px;
-                text-align: left;
-            """)
+            self._set_style_property(self.login_button, "loginState", "error")
             
-            QMessageBox.warning(self, "ログイン失敗", "Googleログインに失敗しました。もう一度試すか、手動でログインしてください。")
+            self.show_banner("Googleログインに失敗しました。もう一度試すか、手動でログインしてください。", "error")
     
     def fetch_images(self):
         """HPBからスタイル画像を取得"""
+        # ボタン無効化だけに頼らず、多重起動をフラグでも防ぐ
+        # (ショートカット等ボタン経由以外の呼び出しでもパイプラインを直列に保つ)
+        if self._fetch_in_progress:
+            return
+
+        # 入力URLは取得開始時に一度だけ読み取り、以降のステージには
+        # Workerの引数として渡す (入力欄の再読み取りはしない)
         hpb_url = self.hpb_url_input.text().strip()
         if not hpb_url:
-            QMessageBox.warning(self, "入力エラー", "HPB URLを入力してください")
+            self.show_banner("HPB URLを入力してください", "warning")
             return
-        
+        self._fetch_in_progress = True
+
         self.log_message(f"HPB URL: {hpb_url} から画像を取得中...")
         self.progress_bar.setValue(0)
         self.statusBar().showMessage("画像を取得中...")
@@ -731,284 +973,265 @@ class MainWindow(QMainWindow):
         self.deselect_all_button.setEnabled(False)
         
         # ボタンのスタイルを変更して無効状態を視覚的に表示
-        self.fetch_button.setStyleSheet(f"""
-            background-color: {self.palette['disabled']};
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            min-height: 40px;
-            padding: 0 20px;
-            border-radius: 6px;
-            text-align: left;
-        """)
+        self._set_style_property(self.fetch_button, "busy", True)
         
-        # Step 1: サロン名を取得
-        worker = Worker(get_salon_name, hpb_url)
-        worker.signals.result.connect(self.on_salon_name_fetched)
+        # サロン名の取得は表示専用で画像URL取得と依存関係がないため並行実行する
+        salon_worker = Worker(get_salon_name, hpb_url)
+        salon_worker.signals.result.connect(self.on_salon_name_fetched)
+        salon_worker.signals.error.connect(self.on_worker_error)
+        self.threadpool.start(salon_worker)
+
+        # 選択された取得順序はQButtonGroupのIDから一度だけ判定する (ID 0 = forward)
+        if self.order_group.checkedId() == 0:
+            fetch_order, order_label = 'forward', '最初のページから'
+        else: # backward is default
+            fetch_order, order_label = 'backward', '最後のページから'
+        self.log_message(f"取得順序: {order_label}")
+
+        # 画像URL取得〜ダウンロードは単一のパイプラインワーカーで実行
+        # (ステージごとのWorker生成とシグナル接続のオーバーヘッドを省く)
+        self._download_cancel_event = threading.Event()
+        worker = Worker(self._run_fetch_pipeline, hpb_url, fetch_order)
+        worker.signals.result.connect(self.on_images_downloaded)
         worker.signals.error.connect(self.on_worker_error)
-        worker.signals.finished.connect(lambda: self.progress_bar.setValue(20))
         self.threadpool.start(worker)
-    
+
+    def _run_fetch_pipeline(self, hpb_url: str, order: str) -> List[str]:
+        """画像URLの取得からダウンロードまでを1つのワーカースレッドで実行する。
+
+        UIへの反映はすべてシグナル経由で行うため、このメソッド自体は
+        ウィジェットに触れない。
+        """
+        image_urls = fetch_latest_style_images(hpb_url, order=order)
+        if not image_urls:
+            self.log_message("画像URLの取得に失敗しました")
+            return []
+
+        self.update_progress_signal.emit(60)
+        self.log_message(f"{len(image_urls)}件の画像URLを取得しました")
+
+        # 1件完了するごとにプログレスバーを 60〜100% の範囲で実際の進捗に合わせて更新
+        def download_percent_callback(completed, total):
+            self.update_progress_signal.emit(60 + int(40 * completed / total))
+
+        return download_images(
+            image_urls,
+            progress_callback=self.log_message,
+            cancel_event=self._download_cancel_event,
+            percent_callback=download_percent_callback
+        )
+
     def on_salon_name_fetched(self, salon_name):
-        """サロン名取得完了後の処理"""
+        """サロン名取得完了後の処理 (表示の更新のみ)"""
         if salon_name:
+            # 進捗はステージの成功時のみ進める (finishedシグナルはエラー時にも発行されるため)
+            if self.progress_bar.value() < 20:
+                self.progress_bar.setValue(20)
             self.salon_name = salon_name
             self.salon_name_label.setText(f"サロン名: {salon_name}")
             self.log_message(f"サロン名を取得しました: {salon_name}")
-            
-            # Step 2: 画像URLを取得
-            hpb_url = self.hpb_url_input.text().strip()
-            
-            # 選択された取得順序を取得
-            if self.order_forward_radio.isChecked():
-                fetch_order = 'forward'
-            else: # backward is default
-                fetch_order = 'backward'
-            self.log_message(f"取得順序: {'最初のページから' if fetch_order == 'forward' else '最後のページから'}")
-            
-            # Worker に order 引数を渡す
-            worker = Worker(fetch_latest_style_images, hpb_url, order=fetch_order)
-            worker.signals.result.connect(self.on_image_urls_fetched)
-            worker.signals.error.connect(self.on_worker_error)
-            worker.signals.finished.connect(lambda: self.progress_bar.setValue(60))
-            self.threadpool.start(worker)
         else:
+            # サロン名は表示専用のため、失敗しても画像取得フローは継続する
             self.log_message("サロン名の取得に失敗しました")
-            self.fetch_button.setEnabled(True)
-            self.statusBar().showMessage("サロン名の取得に失敗しました")
-            
-    def on_image_urls_fetched(self, image_urls):
-        """画像URL取得完了後の処理"""
-        if image_urls and len(image_urls) > 0:
-            self.log_message(f"{len(image_urls)}件の画像URLを取得しました")
-            
-            # 画像ダウンロード進捗ログ用コールバック関数
-            def download_progress_callback(message):
-                self.log_message(message)
-            
-            # Step 3: 画像をダウンロード
-            worker = Worker(download_images, image_urls, progress_callback=download_progress_callback)
-            worker.signals.result.connect(self.on_images_downloaded)
-            worker.signals.error.connect(self.on_worker_error)
-            worker.signals.finished.connect(lambda: self.progress_bar.setValue(100))
-            self.threadpool.start(worker)
-        else:
-            self.log_message("画像URLの取得に失敗しました")
-            self.fetch_button.setEnabled(True)
-            self.statusBar().showMessage("画像URLの取得に失敗しました")
-    
+
     def on_images_downloaded(self, image_paths):
         """画像ダウンロード完了後の処理"""
         if image_paths and len(image_paths) > 0:
             self.image_paths = image_paths
             self.log_message(f"{len(image_paths)}件の画像をダウンロードしました")
-            self.display_images(image_paths)
+
+            # サムネイルのスケーリングはGUIスレッドをブロックしないようワーカーで実行
+            # (QPixmapCache はGUIスレッド専用のため、未キャッシュ分をここで選別して渡す)
+            missing_paths = [p for p in image_paths if QPixmapCache.find(_pixmap_cache_key(p)) is None]
+            thumb_worker = Worker(self._load_thumbnails, missing_paths)
+            thumb_worker.signals.result.connect(self._on_thumbnails_ready)
+            thumb_worker.signals.error.connect(self.on_worker_error)
+            self.threadpool.start(thumb_worker)
+
             self.progress_bar.setValue(100)
             self.statusBar().showMessage(f"{len(image_paths)}件の画像を取得しました")
-            
-            # UI要素を有効化
-            self.upload_button.setEnabled(True)
-            self.select_all_button.setEnabled(True)
-            self.deselect_all_button.setEnabled(True)
-            
+
+            # 操作ボタンの有効化はモデル再構築後 (_on_thumbnails_ready) に行う。
+            # ここで有効化するとモデルがまだ前回の取得結果のままの間に
+            # 投稿操作ができてしまう
+
             # ボタンスタイルを元に戻す
-            self.fetch_button.setStyleSheet(f"""
-                background-color: {self.palette['primary']};
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 40px;
-                padding: 0 20px;
-                border-radius: 6px;
-                text-align: left;
-            """)
+            self._set_style_property(self.fetch_button, "busy", False)
             
             # 成功メッセージを表示
-            QMessageBox.information(
-                self, 
-                "画像取得完了", 
-                f"{len(image_paths)}件の画像を取得しました。\n投稿する画像を選択してください。"
-            )
+            self.show_banner(f"{len(image_paths)}件の画像を取得しました。投稿する画像を選択してください。")
             
         else:
             self.log_message("画像のダウンロードに失敗しました")
             self.fetch_button.setEnabled(True)
             
             # ボタンスタイルを元に戻す
-            self.fetch_button.setStyleSheet(f"""
-                background-color: {self.palette['primary']};
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 40px;
-                padding: 0 20px;
-                border-radius: 6px;
-                text-align: left;
-            """)
+            self._set_style_property(self.fetch_button, "busy", False)
             
             self.statusBar().showMessage("画像のダウンロードに失敗しました")
-        
+
+        self._fetch_in_progress = False
         self.fetch_button.setEnabled(True)
     
+    def _load_thumbnails(self, image_paths: List[str]):
+        """画像をサムネイルサイズにスケーリングする (ワーカースレッドで実行)。
+
+        QPixmap はGUIスレッド以外で生成できないため、スレッドセーフな QImage を返す。
+        """
+        images = []
+        for image_path in image_paths:
+            image = _read_scaled_image(image_path)
+            if image.isNull():
+                logger.warning(f"サムネイル生成に失敗しました: {image_path}")
+                continue
+            images.append((image_path, image))
+        return images
+
+    def _on_thumbnails_ready(self, images):
+        """スケーリング済みサムネイルをキャッシュに登録して表示する (GUIスレッドで実行)"""
+        for image_path, image in images:
+            QPixmapCache.insert(_pixmap_cache_key(image_path), QPixmap.fromImage(image))
+        self.display_images(self.image_paths)
+
+        # モデルが今回の取得結果に置き換わってから操作を受け付ける
+        self.upload_button.setEnabled(True)
+        self.select_all_button.setEnabled(True)
+        self.deselect_all_button.setEnabled(True)
+
     def display_images(self, image_paths: List[str]):
-        """ダウンロードした画像を表示エリアに表示"""
-        # 既存の画像とチェックボックスをクリア
-        for i in reversed(range(self.images_grid.count())): 
-            self.images_grid.itemAt(i).widget().setParent(None)
-        self.image_checkboxes.clear()
-        
-        # サムネイルサイズ - 大きく表示
-        thumbnail_size = 200
-        
-        # グリッド内の列数を計算（ウィンドウサイズに応じて調整）
-        grid_columns = max(3, min(5, self.width() // 250))
-        
-        # 画像をグリッドで表示
-        for idx, image_path in enumerate(image_paths):
-            row, col = divmod(idx, grid_columns)
-            
-            # 画像フレーム
-            frame = QFrame()
-            frame.setStyleSheet(f"""
-                border: 1px solid {self.palette['card_border']};
-                border-radius: 10px;
-                background-color: white;
-                margin: 8px;
-            """)
-            
-            # 影をつけるのは難しいので、より洗練された枠線効果を適用
-            frame_layout = QVBoxLayout(frame)
-            frame_layout.setContentsMargins(0, 0, 0, 0)
-            frame_layout.setSpacing(0)
-            
-            # 画像コンテナ（上部）
-            image_container = QWidget()
-            image_container.setFixedHeight(thumbnail_size + 20)
-            image_container.setStyleSheet(f"""
-                background-color: white;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                border-bottom: 1px solid {self.palette['card_border']};
-            """)
-            
-            image_container_layout = QVBoxLayout(image_container)
-            image_container_layout.setContentsMargins(10, 10, 10, 10)
-            image_container_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # 画像のロードと表示
-            pixmap = QPixmap(image_path)
-            scaled_pixmap = pixmap.scaled(
-                thumbnail_size, thumbnail_size, 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            image_label = QLabel()
-            image_label.setPixmap(scaled_pixmap)
-            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            image_label.setStyleSheet("""
-                border: none;
-                background-color: transparent;
-            """)
-            image_container_layout.addWidget(image_label)
-            frame_layout.addWidget(image_container)
-            
-            # 情報コンテナ（下部）
-            info_container = QWidget()
-            info_container.setStyleSheet(f"""
-                background-color: #f8f9fa;
-                border-bottom-left-radius: 10px;
-                border-bottom-right-radius: 10px;
-                padding: 5px;
-            """)
-            
-            info_layout = QVBoxLayout(info_container)
-            info_layout.setContentsMargins(10, 8, 10, 8)
-            info_layout.setSpacing(6)
-            
-            # ファイル名表示（省略表示）
-            filename = os.path.basename(image_path)
-            if len(filename) > 20:
-                # ファイル名が長い場合は省略
-                display_name = filename[:10] + "..." + filename[-7:]
+        """ダウンロードした画像を一覧ビューに表示"""
+        # 一括更新中の行単位の再描画を止め、最後に1回だけ描画させる
+        self.image_list_view.setUpdatesEnabled(False)
+        self._updating_model = True
+        try:
+            self._populate_image_model(image_paths)
+        finally:
+            self._updating_model = False
+            self.image_list_view.setUpdatesEnabled(True)
+        # 全アイテムがチェック済みで表示されるため、カウンタは走査せずに確定する
+        self._checked_count = len(image_paths)
+
+    def _on_item_changed(self, item):
+        """ユーザーのチェック操作に応じて選択数カウンタを増減する。
+
+        アイテムは編集不可のため、一括更新中以外の itemChanged は
+        チェック状態の切り替えを意味する。
+        """
+        if self._updating_model:
+            return
+        if item.checkState() == Qt.CheckState.Checked:
+            self._checked_count += 1
+        else:
+            self._checked_count -= 1
+
+    def _populate_image_model(self, image_paths: List[str]):
+        """画像パスのリストをモデルに反映する"""
+        # 既存アイテムは破棄せず行数だけ合わせ、内容をその場で更新する
+        # (クリア→再生成よりもモデル通知とアイテム割り当てが少ない)
+        while self.image_model.rowCount() > len(image_paths):
+            self.image_model.removeRow(self.image_model.rowCount() - 1)
+
+        for row, image_path in enumerate(image_paths):
+            # アイコンはパス+更新時刻ごとに一度だけ生成し、再表示時はインスタンスを共有する
+            cache_key = _pixmap_cache_key(image_path)
+            icon = self._icon_cache.get(cache_key)
+            if icon is None:
+                # 画像のロード (ワーカーでスケーリング済みのキャッシュを利用)
+                scaled_pixmap = QPixmapCache.find(cache_key)
+                if scaled_pixmap is None:
+                    # キャッシュ未命中時のフォールバック (同期ロード)
+                    scaled_pixmap = QPixmap.fromImage(_read_scaled_image(image_path))
+                    QPixmapCache.insert(cache_key, scaled_pixmap)
+                icon = QIcon(scaled_pixmap)
+                self._icon_cache[cache_key] = icon
+                # 上限超過分は挿入順に破棄する (古いフェッチ結果から追い出される)
+                while len(self._icon_cache) > ICON_CACHE_MAX_ENTRIES:
+                    self._icon_cache.pop(next(iter(self._icon_cache)))
+
+            # ファイル名表示（省略表示、結果はパスごとにメモ化される）
+            filename, display_name = _display_names(image_path)
+
+            if row < self.image_model.rowCount():
+                item = self.image_model.item(row)
             else:
-                display_name = filename
-                
-            name_label = QLabel(display_name)
-            name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            name_label.setStyleSheet(f"""
-                color: {self.palette['text']};
-                font-size: 11px;
-                font-weight: bold;
-                padding: 2px;
-            """)
-            name_label.setToolTip(filename)  # 完全なファイル名をツールチップで表示
-            info_layout.addWidget(name_label)
-            
-            # チェックボックス（デフォルトで選択済み）
-            checkbox_container = QWidget()
-            checkbox_container.setStyleSheet("background-color: transparent;")
-            checkbox_layout = QHBoxLayout(checkbox_container)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            checkbox_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            checkbox = QCheckBox("選択する")
-            checkbox.setChecked(True)
-            checkbox.setProperty("image_path", image_path)
-            checkbox.setStyleSheet(f"""
-                font-size: 12px;
-                color: {self.palette['text']};
-                spacing: 5px;
-            """)
-            self.image_checkboxes.append(checkbox)
-            checkbox_layout.addWidget(checkbox)
-            
-            info_layout.addWidget(checkbox_container)
-            frame_layout.addWidget(info_container)
-            
-            self.images_grid.addWidget(frame, row, col)
-        
-        # 画像枠の最小幅を設定して見切れを防止
-        for col in range(grid_columns):
-            self.images_grid.setColumnMinimumWidth(col, thumbnail_size + 40)
-    
+                item = QStandardItem()
+                item.setCheckable(True)
+                item.setEditable(False)
+                self.image_model.appendRow(item)
+            item.setIcon(icon)
+            item.setText(display_name)
+            item.setData(image_path, Qt.ItemDataRole.UserRole)
+            item.setCheckState(Qt.CheckState.Checked)  # デフォルトで選択済み
+            item.setToolTip(filename)  # 完全なファイル名をツールチップで表示
+
     def select_all_images(self):
         """全ての画像を選択"""
-        for checkbox in self.image_checkboxes:
-            checkbox.setChecked(True)
-    
+        self._updating_model = True
+        try:
+            for row in range(self.image_model.rowCount()):
+                self.image_model.item(row).setCheckState(Qt.CheckState.Checked)
+        finally:
+            self._updating_model = False
+        self._checked_count = self.image_model.rowCount()
+
     def deselect_all_images(self):
         """全ての画像の選択を解除"""
-        for checkbox in self.image_checkboxes:
-            checkbox.setChecked(False)
+        self._updating_model = True
+        try:
+            for row in range(self.image_model.rowCount()):
+                self.image_model.item(row).setCheckState(Qt.CheckState.Unchecked)
+        finally:
+            self._updating_model = False
+        self._checked_count = 0
     
     def upload_selected_images(self):
         """選択された画像をGBPに投稿"""
         gbp_url = self.gbp_url_input.text().strip()
         if not gbp_url:
-            QMessageBox.warning(self, "入力エラー", "GBP URLを入力してください")
+            self.show_banner("GBP URLを入力してください", "warning")
             return
         
-        # 選択された画像のパスリストを作成
-        selected_paths = []
-        for checkbox in self.image_checkboxes:
-            if checkbox.isChecked():
-                selected_paths.append(checkbox.property("image_path"))
-        
-        if not selected_paths:
-            QMessageBox.warning(self, "選択エラー", "投稿する画像を選択してください")
+        # カウンタで未選択を即判定する (モデル全走査は選択がある場合のみ)
+        if self._checked_count == 0:
+            self.show_banner("投稿する画像を選択してください", "warning")
             return
+
+        # 選択された画像のパスリストを内包表記で一括構築
+        # パスは各行が実際に表示しているもの (UserRole) を使う。
+        # self.image_paths は取得完了時点で差し替わるため、モデル再構築前に
+        # 行番号で引くと別の画像を指してしまう
+        selected_paths = [
+            self.image_model.item(row).data(Qt.ItemDataRole.UserRole)
+            for row in range(self.image_model.rowCount())
+            if self.image_model.item(row).checkState() == Qt.CheckState.Checked
+        ]
         
         self.log_message(f"{len(selected_paths)}件の画像を投稿準備中...")
         self.log_message(f"GBP URL: {gbp_url}")
-        
-        # ログイン状態を確認
+
+        # 確認結果が新しいうちはブラウザ起動を伴う再確認を省略する
+        if (self._login_state and
+                time.monotonic() - self._login_checked_at < LOGIN_STATE_TTL_SECONDS):
+            self.proceed_with_upload(True, gbp_url, selected_paths)
+            return
+
+        # ログイン状態を確認し、結果をキャッシュしてから続行する
         check_worker = Worker(check_login)
-        check_worker.signals.result.connect(lambda logged_in: self.proceed_with_upload(logged_in, gbp_url, selected_paths))
+
+        def on_check_result(logged_in):
+            self._record_login_state(logged_in)
+            self.proceed_with_upload(logged_in, gbp_url, selected_paths)
+
+        check_worker.signals.result.connect(on_check_result)
         check_worker.signals.error.connect(self.on_worker_error)
         check_worker.signals.finished.connect(lambda: self.upload_button.setEnabled(True))
         self.threadpool.start(check_worker)
     
+    def _record_login_state(self, is_logged_in: bool):
+        """ログイン状態の確認・ログイン結果をTTL付きでキャッシュする"""
+        self._login_state = is_logged_in
+        self._login_checked_at = time.monotonic()
+
     def proceed_with_upload(self, is_logged_in, gbp_url, selected_paths):
         """ログイン状態に応じてアップロードを続行するかログインを促す"""
         if not is_logged_in:
@@ -1026,16 +1249,7 @@ class MainWindow(QMainWindow):
         self.upload_button.setEnabled(False)
         
         # ボタンのスタイルを変更して処理中状態を視覚的に表示
-        self.upload_button.setStyleSheet(f"""
-            background-color: {self.palette['disabled']};
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            min-height: 40px;
-            padding: 0 20px;
-            border-radius: 6px;
-            text-align: left;
-        """)
+        self._set_style_property(self.upload_button, "busy", True)
         
         self.statusBar().showMessage("GBPに画像をアップロード中...")
         self.progress_bar.setValue(0)
@@ -1058,35 +1272,17 @@ class MainWindow(QMainWindow):
             self.progress_bar.setValue(100)
             
             # ボタンスタイルを元に戻す
-            self.upload_button.setStyleSheet(f"""
-                background-color: {self.palette['secondary']};
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 40px;
-                padding: 0 20px;
-                border-radius: 6px;
-                text-align: left;
-            """)
+            self._set_style_property(self.upload_button, "busy", False)
             
-            QMessageBox.information(self, "投稿完了", "画像の投稿が完了しました。")
+            self.show_banner("画像の投稿が完了しました。")
         else:
             self.log_message("画像の投稿に失敗しました")
             self.statusBar().showMessage("画像投稿失敗")
             
             # ボタンスタイルを元に戻す
-            self.upload_button.setStyleSheet(f"""
-                background-color: {self.palette['secondary']};
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 40px;
-                padding: 0 20px;
-                border-radius: 6px;
-                text-align: left;
-            """)
+            self._set_style_property(self.upload_button, "busy", False)
             
-            QMessageBox.warning(self, "投稿失敗", "画像の投稿に失敗しました。ログイン状態とGBP URLを確認してください。")
+            self.show_banner("画像の投稿に失敗しました。ログイン状態とGBP URLを確認してください。", "error")
     
     def on_worker_error(self, error_msg):
         """ワーカースレッドでエラーが発生した場合の処理"""
@@ -1094,28 +1290,11 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("エラーが発生しました")
         
         # ボタンスタイルを元に戻す
-        self.fetch_button.setStyleSheet(f"""
-            background-color: {self.palette['primary']};
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            min-height: 40px;
-            padding: 0 20px;
-            border-radius: 6px;
-            text-align: left;
-        """)
-        
-        self.upload_button.setStyleSheet(f"""
-            background-color: {self.palette['secondary']};
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            min-height: 40px;
-            padding: 0 20px;
-            border-radius: 6px;
-            text-align: left;
-        """)
+        self._set_style_property(self.fetch_button, "busy", False)
         
+        self._set_style_property(self.upload_button, "busy", False)
+
+        self._fetch_in_progress = False
         self.fetch_button.setEnabled(True)
         
     def perform_manual_google_login(self):
@@ -1136,38 +1315,23 @@ class MainWindow(QMainWindow):
     
     def on_manual_login_result(self, login_success):
         """手動ログイン結果の処理"""
+        self._record_login_state(login_success)
         if login_success:
             self.log_message("Google手動ログインが完了しました")
             self.statusBar().showMessage("Google手動ログイン完了")
             
             # ログイン成功状態を視覚的に表示
-            self.login_button.setStyleSheet(f"""
-                background-color: {self.palette['success']};
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 6px;
-                min-height: 36px;
-                text-align: left;
-            """)
+            self._set_style_property(self.login_button, "loginState", "ok")
             
-            QMessageBox.information(self, "ログイン完了", "Google手動ログインが完了しました。画像投稿が可能です。")
+            self.show_banner("Google手動ログインが完了しました。画像投稿が可能です。")
         else:
             self.log_message("Google手動ログインに失敗しました")
             self.statusBar().showMessage("Google手動ログイン失敗")
             
             # ログイン失敗状態を視覚的に表示
-            self.login_button.setStyleSheet(f"""
-                background-color: {self.palette['error']};
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 6px;
-                min-height: 36px;
-                text-align: left;
-            """)
+            self._set_style_property(self.login_button, "loginState", "error")
             
-            QMessageBox.warning(self, "ログイン失敗", "Google手動ログインに失敗しました。もう一度試すか、別の方法でログインしてください。")
+            self.show_banner("Google手動ログインに失敗しました。もう一度試すか、別の方法でログインしてください。", "error")
     
     def closeEvent(self, event):
         """アプリケーションが閉じられる際の処理"""
@@ -1179,6 +1343,9 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             logger.info("アプリケーションを終了します")
+            # 実行中のダウンロードがあれば中断して帯域を無駄にしない
+            if self._download_cancel_event is not None:
+                self._download_cancel_event.set()
             event.accept()
         else:
             event.ignore() 
\ No newline at end of file
@@ -5,6 +5,7 @@ import sys
 import shutil
 import tempfile
 import json
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 
@@ -12,29 +13,35 @@ from pathlib import Path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.hpb_scraper import (
-    get_salon_name, 
-    _get_style_page_info, 
-    fetch_latest_style_images, 
+    get_salon_name,
+    _get_style_page_info,
+    fetch_latest_style_images,
     download_images,
-    _get_cleaned_image_url
+    _get_cleaned_image_url,
+    MAXPAGE_CACHE_PATH,
+    ETAG_CACHE_PATH
 )
 
 
+@lru_cache(maxsize=None)
+def _load_fixture(filename):
+    """テスト用HTMLフィクスチャをモジュール単位で一度だけ読み込む"""
+    with open(os.path.join(os.path.dirname(__file__), 'test_data', filename), 'rb') as f:
+        return f.read()
+
+
 class TestHPBScraper(unittest.TestCase):
-    
+
     def setUp(self):
         # テスト用の一時ディレクトリを作成
         self.temp_dir = tempfile.mkdtemp()
-        
+
         # テスト用のHPB URL
         self.test_hpb_url = "https://beauty.hotpepper.jp/slnH000135046/"
-        
-        # テスト用のHTMLとレスポンスを準備
-        with open(os.path.join(os.path.dirname(__file__), 'test_data', 'hpb_salon_page.html'), 'rb') as f:
-            self.salon_page_html = f.read()
-        
-        with open(os.path.join(os.path.dirname(__file__), 'test_data', 'hpb_style_page.html'), 'rb') as f:
-            self.style_page_html = f.read()
+
+        # テスト用のHTML (読み込み結果はテスト間で共有される)
+        self.salon_page_html = _load_fixture('hpb_salon_page.html')
+        self.style_page_html = _load_fixture('hpb_style_page.html')
         
         # 一時的に config.json をモック
         self.orig_config = None
@@ -59,6 +66,11 @@ class TestHPBScraper(unittest.TestCase):
         os.makedirs('config', exist_ok=True)
         with open('config/config.json', 'w') as f:
             json.dump(self.test_config, f)
+
+        # 前回実行時のキャッシュが残っていると結果が変わるため削除
+        for cache_path in (MAXPAGE_CACHE_PATH, ETAG_CACHE_PATH):
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
     
     def tearDown(self):
         # テスト用の一時ディレクトリを削除
@@ -75,6 +87,8 @@ class TestHPBScraper(unittest.TestCase):
         mock_response.status_code = status_code
         mock_response.raise_for_status = Mock()
         mock_response.url = url
+        # ストリーミングダウンロード (iter_content) に対応
+        mock_response.iter_content = Mock(return_value=[content])
         return mock_response
     
     def test_get_cleaned_image_url(self):
@@ -121,6 +135,21 @@ class TestHPBScraper(unittest.TestCase):
         self.assertEqual(max_page, 8)  # モックHTMLに「1/8ページ」とある想定
         mock_make_request.assert_called_once()
     
+    @patch('src.hpb_scraper._make_request')
+    def test_get_style_page_info_uses_cache(self, mock_make_request):
+        """最大ページ数キャッシュによりプローブ用リクエストが省略されることをテスト"""
+        mock_make_request.return_value = self._create_mock_response(self.style_page_html)
+
+        # 1回目: リクエストを送信してキャッシュに保存
+        _get_style_page_info(self.test_hpb_url)
+        self.assertEqual(mock_make_request.call_count, 1)
+
+        # 2回目: キャッシュが使用され、リクエストは発生しない
+        style_base_url, max_page = _get_style_page_info(self.test_hpb_url)
+        self.assertEqual(mock_make_request.call_count, 1)
+        self.assertEqual(style_base_url, "https://beauty.hotpepper.jp/slnH000135046/style/")
+        self.assertEqual(max_page, 8)
+
     @patch('src.hpb_scraper._make_request')
     @patch('src.hpb_scraper._get_style_page_info')
     def test_fetch_latest_style_images(self, mock_get_style_page_info, mock_make_request):